@@ -0,0 +1,125 @@
+import hashlib
+import os
+import threading
+import weakref
+from collections import OrderedDict
+
+import arcade
+
+MAX_CACHED_ASSETS = 64
+GENERATED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "textures")
+
+
+class AssetCache:
+    def __init__(self, capacity=MAX_CACHED_ASSETS):
+        self.capacity = capacity
+        self.assets = OrderedDict()
+        self.refs = {}
+        self.loading = {}
+        self.lock = threading.RLock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self):
+        return len(self.assets)
+
+    def sound(self, path, owner=None):
+        return self.acquire(("sound", path), arcade.load_sound, path, owner)
+
+    def texture(self, path, owner=None):
+        return self.acquire(("texture", path), arcade.load_texture, path, owner)
+
+    def generated(self, generator, *params, owner=None):
+        digest = hashlib.sha1(repr(params).encode("utf-8")).hexdigest()[:16]
+        name = f"{generator.__name__}-{digest}"
+        path = os.path.join(GENERATED_DIR, name + ".png")
+        return self.acquire(("generated", name), lambda path: load_generated(path, generator, params), path, owner)
+
+    def acquire(self, key, loader, path, owner=None):
+        asset = self.lookup(key)
+        if asset is None:
+            asset = self.load(key, loader, path)
+        with self.lock:
+            if owner is not None:
+                self.refs[key] = self.refs.get(key, 0) + 1
+                weakref.finalize(owner, self.release, key)
+            self.evict()
+        return asset
+
+    def lookup(self, key):
+        while True:
+            with self.lock:
+                asset = self.assets.get(key)
+                if asset is not None:
+                    self.hits += 1
+                    self.assets.move_to_end(key)
+                    return asset
+                loading = self.loading.get(key)
+                if loading is None:
+                    self.loading[key] = threading.Event()
+                    self.misses += 1
+                    return None
+            loading.wait()
+
+    def load(self, key, loader, path):
+        try:
+            asset = loader(path)
+            with self.lock:
+                self.assets[key] = asset
+        finally:
+            with self.lock:
+                self.loading.pop(key).set()
+        return asset
+
+    def release(self, key):
+        with self.lock:
+            count = self.refs.get(key, 0) - 1
+            if count > 0:
+                self.refs[key] = count
+            else:
+                self.refs.pop(key, None)
+            self.evict()
+
+    def evict(self):
+        for key in list(self.assets):
+            if len(self.assets) <= self.capacity:
+                return
+            if not self.refs.get(key):
+                del self.assets[key]
+                self.evictions += 1
+
+    def clear(self):
+        with self.lock:
+            for key in list(self.assets):
+                if not self.refs.get(key):
+                    del self.assets[key]
+
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "cached": len(self.assets),
+            "referenced": len(self.refs),
+        }
+
+
+def load_generated(path, generator, params):
+    if os.path.exists(path):
+        try:
+            return arcade.load_texture(path)
+        except (OSError, ValueError):
+            pass
+    texture = generator(*params)
+    try:
+        os.makedirs(GENERATED_DIR, exist_ok=True)
+        tmp_path = path + ".tmp"
+        texture.image.save(tmp_path, format="PNG")
+        os.replace(tmp_path, path)
+    except OSError:
+        pass
+    return texture
+
+
+asset_cache = AssetCache()
@@ -0,0 +1,37 @@
+import arcade
+
+from assets import asset_cache
+
+PLAYER_TEXTURE = ":resources:images/animated_characters/female_adventurer/femaleAdventurer_idle.png"
+WALL_TEXTURE = ":resources:images/tiles/grassMid.png"
+CRYSTAL_TEXTURE = ":resources:images/items/gemBlue.png"
+SPIKE_TEXTURE = ":resources:images/tiles/spikes.png"
+PLATFORM_TEXTURE = ":resources:images/tiles/stoneMid.png"
+ENEMY_TEXTURE = ":resources:images/enemies/slimeBlock.png"
+LEVEL_ART = (PLAYER_TEXTURE, WALL_TEXTURE, CRYSTAL_TEXTURE, SPIKE_TEXTURE, PLATFORM_TEXTURE, ENEMY_TEXTURE)
+
+
+class LevelAtlas:
+    def __init__(self, paths=LEVEL_ART):
+        self.paths = paths
+        self.textures = {}
+        self.atlas = None
+        self.builds = 0
+
+    def build(self):
+        atlas = arcade.get_window().ctx.default_atlas
+        if self.atlas is atlas:
+            return
+        for path in self.paths:
+            if path not in self.textures:
+                self.textures[path] = asset_cache.texture(path, self)
+            atlas.add(self.textures[path])
+        self.atlas = atlas
+        self.builds += 1
+
+    def texture(self, path):
+        self.build()
+        return self.textures[path]
+
+
+level_atlas = LevelAtlas()
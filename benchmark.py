@@ -0,0 +1,225 @@
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import arcade
+
+from geometry import TILE_SIZE
+from headless import create_window, load_view, walk_right_script
+from level_loader import SECTION_FIELDS, compile_level, load_level
+
+BENCHMARK_TARGETS = [
+    (0, "study level.py", "TutorialLevel"),
+    (1, "Первый уровень", "Level1"),
+    (2, "level2.py", "Level2"),
+    (3, "Третий уровень", "Level3"),
+    (4, "level4.py", "Level4"),
+    (0, "Главное меню", "create_game_view", 0),
+    (1, "Главное меню", "create_game_view", 1),
+    (2, "Главное меню", "create_game_view", 2),
+    (3, "Главное меню", "create_game_view", 3),
+    (4, "Главное меню", "create_game_view", 4),
+]
+SUBSYSTEMS = ("tick", "physics", "moving_objects", "collisions", "particles", "draw")
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks")
+SHIFTED_FIELDS = ("x", "boundary_left", "boundary_right")
+
+
+class Timings:
+    def __init__(self):
+        self.samples = {name: [] for name in SUBSYSTEMS}
+
+    def wrap(self, name, func):
+        samples = self.samples[name]
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            result = func(*args, **kwargs)
+            samples.append(time.perf_counter() - start)
+            return result
+
+        return timed
+
+    def summary(self):
+        result = {}
+        for name, samples in self.samples.items():
+            if not samples:
+                continue
+            ordered = sorted(samples)
+            result[name] = {
+                "calls": len(ordered),
+                "mean_us": round(sum(ordered) / len(ordered) * 1e6, 2),
+                "p50_us": round(ordered[len(ordered) // 2] * 1e6, 2),
+                "p95_us": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1e6, 2),
+            }
+        return result
+
+
+def level_span(level_data):
+    right = max(
+        (x + width * TILE_SIZE for x, y, width in level_data.rows("platforms")),
+        default=0,
+    )
+    return right + 2 * TILE_SIZE
+
+
+def enlarge_level(level_data, copies):
+    if copies <= 1:
+        return level_data
+    span = level_span(level_data)
+    raw = {
+        "name": level_data.name,
+        "player_start": list(level_data.player_start),
+        "music": level_data.music,
+    }
+    for section, fields in SECTION_FIELDS.items():
+        items = []
+        for copy in range(copies):
+            for row in level_data.rows(section):
+                item = {field: value for field, value in zip(fields, row) if value is not None}
+                for field in SHIFTED_FIELDS:
+                    if field in item:
+                        item[field] += copy * span
+                items.append(item)
+        raw[section] = items
+    return compile_level(raw)
+
+
+def benchmark_target(window, target, ticks, scale, draw_every):
+    level_num, path, class_name, *args = target
+    level_data = enlarge_level(load_level(level_num), scale)
+    view = load_view(path, class_name, *args, level_data=level_data)
+    view.particles.seed(0)
+    window.show_view(view)
+
+    timings = Timings()
+    view.physics_engine.update = timings.wrap("physics", view.physics_engine.update)
+    view.update_moving_objects = timings.wrap("moving_objects", view.update_moving_objects)
+    view.triggers.query = timings.wrap("collisions", view.triggers.query)
+    view.particles.update = timings.wrap("particles", view.particles.update)
+    fixed_update = timings.wrap("tick", view.fixed_update)
+
+    def render():
+        view.on_draw()
+        window.ctx.finish()
+
+    draw = timings.wrap("draw", render)
+
+    script = walk_right_script(ticks)
+    restarts = 0
+    candidates = 0
+    checks = 0
+    for tick in range(ticks):
+        script.apply(view, tick)
+        fixed_update()
+        candidates += view.triggers.candidates
+        checks += view.triggers.checks
+        if window.current_view is not view:
+            restarts += 1
+            view.reset()
+            window.show_view(view)
+            view.on_key_press(arcade.key.RIGHT, 0)
+        if draw_every and tick % draw_every == 0:
+            draw()
+
+    return {
+        "target": " ".join([path, class_name] + [str(arg) for arg in args]),
+        "scale": scale,
+        "ticks": ticks,
+        "restarts": restarts,
+        "tiles": int(sum(width for x, y, width in level_data.rows("platforms"))),
+        "rows": {section: level_data.count(section) for section in SECTION_FIELDS},
+        "draw_calls": view.culled_scene.draw_calls,
+        "trigger_queries": view.triggers.queries,
+        "trigger_candidates": round(candidates / ticks, 2),
+        "trigger_checks": round(checks / ticks, 2),
+        "timings": timings.summary(),
+    }
+
+
+def git_revision():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def run_suite(ticks=600, scales=(1, 4), draw_every=10, targets=BENCHMARK_TARGETS):
+    window = create_window()
+    results = []
+    for target in targets:
+        for scale in scales:
+            result = benchmark_target(window, target, ticks, scale, draw_every)
+            results.append(result)
+            print(format_result(result))
+    return {
+        "revision": git_revision(),
+        "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "arcade": arcade.version.VERSION,
+        "ticks": ticks,
+        "scales": list(scales),
+        "results": results,
+    }
+
+
+def format_result(result):
+    columns = " ".join(
+        f"{name}={result['timings'][name]['mean_us']:.0f}"
+        for name in SUBSYSTEMS if name in result["timings"]
+    )
+    return f"{result['target']:<28} x{result['scale']:<3} {result['tiles']:>6} tiles  {columns} us"
+
+
+def compare(previous, current):
+    before = {(r["target"], r["scale"]): r["timings"] for r in previous["results"]}
+    for result in current["results"]:
+        old = before.get((result["target"], result["scale"]))
+        if not old:
+            continue
+        changes = []
+        for name, timing in result["timings"].items():
+            if name in old and old[name]["p50_us"]:
+                change = (timing["p50_us"] / old[name]["p50_us"] - 1) * 100
+                changes.append(f"{name} {change:+.0f}%")
+        print(f"{result['target']:<28} x{result['scale']:<3} " + ", ".join(changes))
+
+
+def main():
+    args = sys.argv[1:]
+    options = {"--ticks": "600", "--scales": "1,4", "--draw-every": "10", "--out": None, "--compare": None}
+    while args:
+        name = args.pop(0)
+        if name not in options or not args:
+            print("usage: python benchmark.py [--ticks N] [--scales 1,4] [--draw-every N] "
+                  "[--out results.json] [--compare previous.json]")
+            sys.exit(1)
+        options[name] = args.pop(0)
+
+    report = run_suite(
+        ticks=int(options["--ticks"]),
+        scales=[int(scale) for scale in options["--scales"].split(",")],
+        draw_every=int(options["--draw-every"]),
+    )
+    out = options["--out"] or os.path.join(RESULTS_DIR, f"{report['revision']}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w", encoding="utf-8") as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+    print(f"saved {out}")
+
+    if options["--compare"]:
+        with open(options["--compare"], encoding="utf-8") as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+import arcade
+
+CULL_MARGIN = 64
+DRAW_ORDER = ("Player", "Walls", "Crystals", "Spikes", "SmallSpikes", "MovingPlatforms", "Enemies")
+STATIC_LISTS = ("Walls", "Crystals", "Spikes", "SmallSpikes")
+
+
+class Chunk:
+    def __init__(self):
+        self.sprites = arcade.SpriteList()
+        self.left = float("inf")
+        self.right = float("-inf")
+        self.bottom = float("inf")
+        self.top = float("-inf")
+
+    def add(self, sprite):
+        self.sprites.append(sprite)
+        self.left = min(self.left, sprite.left)
+        self.right = max(self.right, sprite.right)
+        self.bottom = min(self.bottom, sprite.bottom)
+        self.top = max(self.top, sprite.top)
+
+    def overlaps(self, left, right, bottom, top):
+        return self.right >= left and self.left <= right and self.top >= bottom and self.bottom <= top
+
+
+class CulledScene:
+    def __init__(self, scene):
+        self.scene = scene
+        self.batches = []
+        self.chunks_drawn = 0
+        self.chunks_total = 0
+        self.draw_calls = 0
+        for name in DRAW_ORDER:
+            if name not in scene:
+                continue
+            if name in STATIC_LISTS and self.batches and self.batches[-1][1] is not None:
+                self.batches[-1][0].append(name)
+            elif name in STATIC_LISTS:
+                self.batches.append(([name], []))
+            else:
+                self.batches.append(([name], None))
+
+    def add_chunks(self, sprites):
+        added = []
+        for names, chunks in self.batches:
+            if chunks is None:
+                continue
+            chunk = Chunk()
+            for name in names:
+                sprite_list = self.scene[name]
+                for sprite in sprites:
+                    if sprite_list in sprite.sprite_lists:
+                        chunk.add(sprite)
+            if len(chunk.sprites):
+                chunks.append(chunk)
+                added.append((chunks, chunk))
+        self.chunks_total += len(added)
+        return added
+
+    def remove_chunks(self, added):
+        for chunks, chunk in added:
+            chunks.remove(chunk)
+        self.chunks_total -= len(added)
+
+    def draw(self, camera):
+        x, y = camera.position
+        left = x + camera.left - CULL_MARGIN
+        right = x + camera.right + CULL_MARGIN
+        bottom = y + camera.bottom - CULL_MARGIN
+        top = y + camera.top + CULL_MARGIN
+        self.chunks_drawn = 0
+        self.draw_calls = 0
+        for names, chunks in self.batches:
+            if chunks is None:
+                sprite_list = self.scene[names[0]]
+                if len(sprite_list):
+                    sprite_list.draw()
+                    self.draw_calls += 1
+                continue
+            for chunk in chunks:
+                if len(chunk.sprites) and chunk.overlaps(left, right, bottom, top):
+                    chunk.sprites.draw()
+                    self.chunks_drawn += 1
+        self.draw_calls += self.chunks_drawn
@@ -0,0 +1,24 @@
+import arcade
+
+SCREEN_WIDTH = 1000
+SCREEN_HEIGHT = 650
+CHARACTER_SCALING = 0.5
+TILE_SIZE = 64
+
+
+def platform_collider(x, y, width):
+    return arcade.SpriteSolidColor(
+        int(width) * TILE_SIZE,
+        TILE_SIZE,
+        center_x=x + (width - 1) * TILE_SIZE / 2,
+        center_y=y,
+    )
+
+
+def set_travel_bounds(sprite, left, right, top, bottom):
+    half_width = sprite.width / 2
+    half_height = sprite.height / 2
+    sprite.boundary_left = None if left is None else left - half_width
+    sprite.boundary_right = None if right is None else right + half_width
+    sprite.boundary_top = None if top is None else top + half_height
+    sprite.boundary_bottom = None if bottom is None else bottom - half_height
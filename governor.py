@@ -0,0 +1,43 @@
+ACTIVE_RATE = 1 / 60
+IDLE_RATE = 1 / 10
+
+
+class FrameGovernor:
+    def __init__(self, active_rate=ACTIVE_RATE, idle_rate=IDLE_RATE):
+        self.active_rate = active_rate
+        self.idle_rate = idle_rate
+        self.window = None
+        self.idle = False
+        self.wakeups = 0
+
+    def attach(self, window):
+        if self.window is window:
+            return
+        self.window = window
+        self.idle = False
+        window.push_handlers(
+            on_key_press=self.wake,
+            on_key_release=self.wake,
+            on_mouse_press=self.wake,
+            on_mouse_motion=self.wake,
+            on_activate=self.wake,
+        )
+
+    def rest(self, window):
+        self.attach(window)
+        if self.idle:
+            return
+        self.idle = True
+        window.set_draw_rate(self.idle_rate)
+        window.set_update_rate(self.idle_rate)
+
+    def wake(self, *args):
+        if not self.idle:
+            return
+        self.idle = False
+        self.wakeups += 1
+        self.window.set_update_rate(self.active_rate)
+        self.window.set_draw_rate(self.active_rate)
+
+
+governor = FrameGovernor()
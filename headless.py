@@ -0,0 +1,137 @@
+import importlib.machinery
+import importlib.util
+import os
+import sys
+import time
+
+os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import arcade
+
+PROJECT_DIR = os.path.dirname(os.path.abspath(__file__))
+PRESS = "press"
+RELEASE = "release"
+
+
+class ScriptedInput:
+    def __init__(self, events=()):
+        self.events = {}
+        for tick, action, key in events:
+            self.events.setdefault(tick, []).append((action, key))
+
+    def apply(self, view, tick):
+        for action, key in self.events.get(tick, ()):
+            if action == PRESS:
+                view.on_key_press(key, 0)
+            else:
+                view.on_key_release(key, 0)
+
+
+def walk_right_events(ticks, jump_every=40):
+    events = [(0, PRESS, arcade.key.RIGHT)]
+    for tick in range(10, ticks, jump_every):
+        events.append((tick, PRESS, arcade.key.UP))
+        events.append((tick + 1, RELEASE, arcade.key.UP))
+    return events
+
+
+def walk_right_script(ticks, jump_every=40):
+    return ScriptedInput(walk_right_events(ticks, jump_every))
+
+
+class HeadlessRunner:
+    def __init__(self, view, script=None):
+        self.view = view
+        self.script = script or ScriptedInput()
+        self.tick = 0
+        self.clock = 0.0
+        self.busy_time = 0.0
+
+    @property
+    def running(self):
+        return self.view.window.current_view is self.view
+
+    def step(self, ticks=1):
+        view = self.view
+        script = self.script
+        step = view.timestep.step
+        start = time.perf_counter()
+        for _ in range(ticks):
+            if not self.running:
+                break
+            script.apply(view, self.tick)
+            view.fixed_update()
+            self.tick += 1
+            self.clock += step
+        self.busy_time += time.perf_counter() - start
+        return self.tick
+
+    def stats(self):
+        return {
+            "ticks": self.tick,
+            "simulated_seconds": round(self.clock, 3),
+            "ticks_per_second": round(self.tick / self.busy_time) if self.busy_time else 0,
+            "us_per_tick": round(self.busy_time / self.tick * 1e6, 2) if self.tick else 0,
+            "crystals": f"{self.view.crystals_collected}/{self.view.total_crystals}",
+            "lives": self.view.player_lives,
+            "player": tuple(round(v, 1) for v in self.view.player_sprite.position),
+            "view": type(self.view.window.current_view).__name__,
+        }
+
+
+def create_window():
+    try:
+        return arcade.get_window()
+    except RuntimeError:
+        return arcade.Window(1000, 650, "headless", visible=False)
+
+
+def project_path(path):
+    return os.path.relpath(os.path.abspath(path), PROJECT_DIR)
+
+
+def load_view(path, class_name, *args, level_data=None):
+    path = os.path.join(PROJECT_DIR, path)
+    module_name = "headless_" + os.path.basename(path).replace(" ", "_").replace(".", "_")
+    module = sys.modules.get(module_name)
+    if module is None:
+        directory = os.path.dirname(os.path.abspath(path))
+        if directory not in sys.path:
+            sys.path.insert(0, directory)
+        loader = importlib.machinery.SourceFileLoader(module_name, path)
+        spec = importlib.util.spec_from_loader(module_name, loader)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[module_name] = module
+        loader.exec_module(module)
+    view = getattr(module, class_name)(*args)
+    if level_data is not None:
+        view.level_data = level_data
+    view.setup()
+    return view
+
+
+def run(path, class_name, *args, ticks=3600, script=None, seed=None):
+    window = create_window()
+    view = load_view(path, class_name, *args)
+    if seed is not None:
+        view.particles.seed(seed)
+    window.show_view(view)
+    runner = HeadlessRunner(view, script or walk_right_script(ticks))
+    runner.step(ticks)
+    return runner
+
+
+def main():
+    if len(sys.argv) < 3:
+        print("usage: python headless.py <file> <ViewClass> [level] [ticks]")
+        sys.exit(1)
+    path, class_name = project_path(sys.argv[1]), sys.argv[2]
+    args = [int(sys.argv[3])] if len(sys.argv) > 3 and sys.argv[3] != "-" else []
+    ticks = int(sys.argv[4]) if len(sys.argv) > 4 else 3600
+    runner = run(path, class_name, *args, ticks=ticks)
+    for key, value in runner.stats().items():
+        print(f"{key}: {value}")
+
+
+if __name__ == "__main__":
+    main()
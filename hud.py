@@ -0,0 +1,65 @@
+import arcade
+from arcade.gl.geometry import quad_2d_fs
+from pyglet.graphics import Batch
+
+
+class Hud:
+    def __init__(self):
+        self.batch = Batch()
+        self.texts = []
+        self.values = {}
+
+    def add(self, text, x, y, color, font_size, **kwargs):
+        label = arcade.Text(text, x, y, color, font_size, batch=self.batch, **kwargs)
+        self.texts.append(label)
+        return label
+
+    def update(self, label, template, *values):
+        if self.values.get(label) != values:
+            self.values[label] = values
+            label.text = template.format(*values)
+
+    def draw(self):
+        self.batch.draw()
+
+
+class RenderCache:
+    def __init__(self, background_color):
+        window = arcade.get_window()
+        self.ctx = window.ctx
+        self.background_color = background_color
+        self.texture = self.ctx.texture(window.get_framebuffer_size(), components=4)
+        self.fbo = self.ctx.framebuffer(color_attachments=[self.texture])
+        self.quad = quad_2d_fs()
+        self.dirty = True
+        self.renders = 0
+
+    def invalidate(self):
+        self.dirty = True
+
+    def draw(self, render):
+        if self.dirty:
+            with self.fbo.activate():
+                self.fbo.clear(color=self.background_color)
+                render()
+            self.dirty = False
+            self.renders += 1
+        self.texture.use(0)
+        with self.ctx.enabled_only():
+            self.quad.render(self.ctx.utility_textured_quad_program)
+
+
+class RenderCachePool:
+    def __init__(self):
+        self.caches = {}
+
+    def get(self, kind, background_color):
+        ctx = arcade.get_window().ctx
+        cache = self.caches.get(kind)
+        if cache is None or cache.ctx is not ctx:
+            cache = self.caches[kind] = RenderCache(background_color)
+        cache.invalidate()
+        return cache
+
+
+render_caches = RenderCachePool()
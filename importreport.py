@@ -0,0 +1,86 @@
+import json
+import os
+import subprocess
+import sys
+
+ENTRY_POINTS = ("Главное меню", "Общий код")
+LAZY_MODULES = (
+    "runtime",
+    "culling",
+    "kinematics",
+    "particles",
+    "profiler",
+    "snapshot",
+    "streaming",
+    "timestep",
+    "triggers",
+)
+LOADER = (
+    "import importlib.machinery, importlib.util, sys; "
+    "sys.path.insert(0, {directory!r}); "
+    "loader = importlib.machinery.SourceFileLoader('entry_point', {path!r}); "
+    "loader.exec_module(importlib.util.module_from_spec(importlib.util.spec_from_loader('entry_point', loader)))"
+)
+
+
+def project_modules(directory):
+    return {name[:-3] for name in os.listdir(directory) if name.endswith(".py")}
+
+
+def measure(path):
+    directory = os.path.dirname(os.path.abspath(path))
+    env = dict(os.environ, ARCADE_HEADLESS="1")
+    code = LOADER.format(directory=directory, path=os.path.abspath(path))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        cwd=directory,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    modules = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|")
+        modules.append((name[1:].rstrip(), int(self_us), int(cumulative_us)))
+    return modules
+
+
+def summarize(path, modules):
+    local = project_modules(os.path.dirname(os.path.abspath(path)))
+    top_level = [(name, cumulative) for name, self_us, cumulative in modules if not name.startswith(" ")]
+    imported = {name.strip() for name, self_us, cumulative in modules}
+    return {
+        "entry_point": path,
+        "total_ms": round(sum(cumulative for name, cumulative in top_level) / 1000, 1),
+        "arcade_ms": round(sum(cumulative for name, cumulative in top_level if name == "arcade") / 1000, 1),
+        "project_modules": {
+            name.strip(): {"self_ms": round(self_us / 1000, 2), "cumulative_ms": round(cumulative / 1000, 2)}
+            for name, self_us, cumulative in modules
+            if name.strip() in local
+        },
+        "eager_level_modules": sorted(imported & set(LAZY_MODULES)),
+    }
+
+
+def main():
+    paths = sys.argv[1:] or list(ENTRY_POINTS)
+    reports = [summarize(path, measure(path)) for path in paths]
+    failed = False
+    for report in reports:
+        print(f"{report['entry_point']}: {report['total_ms']} мс (arcade {report['arcade_ms']} мс)")
+        for name, timing in sorted(report["project_modules"].items(), key=lambda item: -item[1]["cumulative_ms"]):
+            print(f"  {name}: {timing['cumulative_ms']} мс")
+        if report["eager_level_modules"]:
+            failed = True
+            print("  загружены при старте: " + ", ".join(report["eager_level_modules"]))
+    with open("import_report.json", "w", encoding="utf-8") as f:
+        json.dump(reports, f, ensure_ascii=False, indent=2)
+    sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+    main()
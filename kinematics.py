@@ -0,0 +1,77 @@
+INF = float("inf")
+
+
+def bound(value, default):
+    return default if value is None else value
+
+
+class KinematicMover:
+    def __init__(self):
+        self.sprites = []
+        self.x = []
+        self.y = []
+        self.vx = []
+        self.vy = []
+        self.left = []
+        self.right = []
+        self.top = []
+        self.bottom = []
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def add(self, sprite):
+        self.sprites.append(sprite)
+        self.x.append(sprite.center_x)
+        self.y.append(sprite.center_y)
+        self.vx.append(sprite.change_x)
+        self.vy.append(sprite.change_y)
+        self.left.append(bound(sprite.boundary_left, -INF))
+        self.right.append(bound(sprite.boundary_right, INF))
+        self.top.append(bound(sprite.boundary_top, INF))
+        self.bottom.append(bound(sprite.boundary_bottom, -INF))
+
+    def remove(self, sprite):
+        if sprite not in self.sprites:
+            return
+        i = self.sprites.index(sprite)
+        for column in (self.sprites, self.x, self.y, self.vx, self.vy, self.left, self.right, self.top, self.bottom):
+            del column[i]
+
+    def sync(self):
+        for i, sprite in enumerate(self.sprites):
+            self.x[i] = sprite.center_x
+            self.y[i] = sprite.center_y
+            self.vx[i] = sprite.change_x
+            self.vy[i] = sprite.change_y
+
+    def update(self):
+        sprites = self.sprites
+        xs, ys, vxs, vys = self.x, self.y, self.vx, self.vy
+        lefts, rights, tops, bottoms = self.left, self.right, self.top, self.bottom
+        for i in range(len(sprites)):
+            vx = vxs[i]
+            vy = vys[i]
+            if not vx and not vy:
+                continue
+            x = xs[i] + vx
+            y = ys[i] + vy
+            if x <= lefts[i]:
+                x = lefts[i]
+                vxs[i] = -vx
+                sprites[i].change_x = -vx
+            elif x >= rights[i]:
+                x = rights[i]
+                vxs[i] = -vx
+                sprites[i].change_x = -vx
+            if y >= tops[i]:
+                y = tops[i]
+                vys[i] = -vy
+                sprites[i].change_y = -vy
+            elif y <= bottoms[i]:
+                y = bottoms[i]
+                vys[i] = -vy
+                sprites[i].change_y = -vy
+            xs[i] = x
+            ys[i] = y
+            sprites[i].position = (x, y)
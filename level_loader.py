@@ -0,0 +1,202 @@
+import glob
+import hashlib
+import json
+import os
+import struct
+from array import array
+
+from geometry import TILE_SIZE
+
+LEVELS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "levels")
+CACHE_DIR = os.path.join(LEVELS_DIR, "cache")
+CACHE_MAGIC = b"CLVL"
+CACHE_VERSION = 2
+STREAM_COLUMN_WIDTH = 1024
+
+NAN = float("nan")
+SECTION_FIELDS = {
+    "platforms": ("x", "y", "width"),
+    "crystals": ("x", "y"),
+    "spikes": ("x", "y"),
+    "small_spikes": ("x", "y"),
+    "moving_platforms": (
+        "x", "y", "change_x", "change_y",
+        "boundary_left", "boundary_right", "boundary_top", "boundary_bottom",
+    ),
+    "enemies": ("x", "y", "scale", "change_x", "boundary_left", "boundary_right"),
+}
+FIELD_DEFAULTS = {"change_x": 0.0, "change_y": 0.0}
+
+_loaded = {}
+
+
+class LevelData:
+    def __init__(self, name, player_start, music, columns, first_column, index):
+        self.name = name
+        self.player_start = player_start
+        self.music = music
+        self.columns = columns
+        self.first_column = first_column
+        self.index = index
+
+    def count(self, section):
+        return len(self.columns[section]) // len(SECTION_FIELDS[section])
+
+    def rows(self, section):
+        values = self.columns[section]
+        width = len(SECTION_FIELDS[section])
+        for i in range(0, len(values), width):
+            yield tuple(None if v != v else v for v in values[i:i + width])
+
+    def row(self, section, index):
+        width = len(SECTION_FIELDS[section])
+        values = self.columns[section][index * width:(index + 1) * width]
+        return tuple(None if v != v else v for v in values)
+
+    def column_entries(self, section, column):
+        entries, offsets = self.index[section]
+        i = column - self.first_column
+        if i < 0 or i >= len(offsets) - 1:
+            return
+        for k in range(offsets[i] * 3, offsets[i + 1] * 3, 3):
+            yield entries[k], entries[k + 1], entries[k + 2]
+
+
+def stream_column(x):
+    return int(x // STREAM_COLUMN_WIDTH)
+
+
+def build_index(columns):
+    buckets = {}
+    for section, fields in SECTION_FIELDS.items():
+        bucket = buckets[section] = {}
+        values = columns[section]
+        for row, i in enumerate(range(0, len(values), len(fields))):
+            x = values[i]
+            if section != "platforms":
+                bucket.setdefault(stream_column(x), []).extend((row, 0, 0))
+                continue
+            tiles = int(values[i + 2])
+            start = 0
+            for tile in range(1, tiles + 1):
+                column = stream_column(x + start * TILE_SIZE)
+                if tile == tiles or stream_column(x + tile * TILE_SIZE) != column:
+                    bucket.setdefault(column, []).extend((row, start, tile - start))
+                    start = tile
+    used = [column for bucket in buckets.values() for column in bucket]
+    first_column = min(used, default=0)
+    last_column = max(used, default=-1)
+    index = {}
+    for section, bucket in buckets.items():
+        entries = array("i")
+        offsets = array("i", [0])
+        for column in range(first_column, last_column + 1):
+            entries.extend(bucket.get(column, ()))
+            offsets.append(len(entries) // 3)
+        index[section] = (entries, offsets)
+    return first_column, index
+
+
+def level_path(level_num):
+    return os.path.join(LEVELS_DIR, f"level{level_num}.json")
+
+
+def load_level(level_num):
+    return load_level_file(level_path(level_num))
+
+
+def load_level_file(path):
+    stat = os.stat(path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+    loaded = _loaded.get(path)
+    if loaded and loaded[0] == stamp:
+        return loaded[1]
+
+    with open(path, "rb") as f:
+        source = f.read()
+    digest = hashlib.sha1(source).hexdigest()[:16]
+    stem = os.path.splitext(os.path.basename(path))[0]
+    cache_path = os.path.join(CACHE_DIR, f"{stem}-{digest}.bin")
+
+    level = read_cache(cache_path)
+    if level is None:
+        level = compile_level(json.loads(source.decode("utf-8")))
+        write_cache(cache_path, stem, level)
+
+    _loaded[path] = (stamp, level)
+    return level
+
+
+def compile_level(raw):
+    columns = {}
+    for section, fields in SECTION_FIELDS.items():
+        values = array("d")
+        for item in raw.get(section, []):
+            if isinstance(item, dict):
+                values.extend(
+                    item.get(field, FIELD_DEFAULTS.get(field, NAN)) for field in fields
+                )
+            else:
+                values.extend(item)
+        columns[section] = values
+    return LevelData(raw["name"], tuple(raw["player_start"]), raw.get("music"), columns, *build_index(columns))
+
+
+def read_cache(cache_path):
+    try:
+        with open(cache_path, "rb") as f:
+            magic, version, header_size = struct.unpack("<4sHI", f.read(10))
+            if magic != CACHE_MAGIC or version != CACHE_VERSION:
+                return None
+            header = json.loads(f.read(header_size).decode("utf-8"))
+            if header.get("column_width") != STREAM_COLUMN_WIDTH:
+                return None
+            columns = {}
+            for section in SECTION_FIELDS:
+                (size,) = struct.unpack("<I", f.read(4))
+                values = array("d")
+                values.fromfile(f, size)
+                columns[section] = values
+            index = {}
+            for section in SECTION_FIELDS:
+                arrays = []
+                for _ in range(2):
+                    (size,) = struct.unpack("<I", f.read(4))
+                    values = array("i")
+                    values.fromfile(f, size)
+                    arrays.append(values)
+                index[section] = tuple(arrays)
+    except (OSError, EOFError, ValueError, struct.error):
+        return None
+    return LevelData(
+        header["name"], tuple(header["player_start"]), header["music"], columns, header["first_column"], index
+    )
+
+
+def write_cache(cache_path, stem, level):
+    header = json.dumps({
+        "name": level.name,
+        "player_start": level.player_start,
+        "music": level.music,
+        "first_column": level.first_column,
+        "column_width": STREAM_COLUMN_WIDTH,
+    }).encode("utf-8")
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        for stale in glob.glob(os.path.join(CACHE_DIR, f"{stem}-*.bin")):
+            os.remove(stale)
+        tmp_path = cache_path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(struct.pack("<4sHI", CACHE_MAGIC, CACHE_VERSION, len(header)))
+            f.write(header)
+            for section in SECTION_FIELDS:
+                values = level.columns[section]
+                f.write(struct.pack("<I", len(values)))
+                values.tofile(f)
+            for section in SECTION_FIELDS:
+                for values in level.index[section]:
+                    f.write(struct.pack("<I", len(values)))
+                    values.tofile(f)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
@@ -0,0 +1,116 @@
+import math
+import random
+
+import arcade
+
+from assets import asset_cache
+
+MAX_PARTICLES = 4096
+PARTICLE_GRAVITY = 0.3
+PARTICLE_SHRINK = 0.95
+PARTICLE_TEXTURE_DIAMETER = 16
+CRYSTAL_COLORS = (
+    (100, 200, 255),
+    (150, 220, 255),
+    (200, 240, 255),
+    (80, 180, 255),
+)
+
+
+def pack_color(color):
+    return (color[0] << 16) | (color[1] << 8) | color[2]
+
+
+class ParticleEmitter:
+    def __init__(self, capacity=MAX_PARTICLES, seed=None):
+        self.capacity = capacity
+        self.random = random.Random(seed)
+        self.count = 0
+        self.x = [0.0] * capacity
+        self.y = [0.0] * capacity
+        self.vx = [0.0] * capacity
+        self.vy = [0.0] * capacity
+        self.life = [0.0] * capacity
+        self.decay = [0.0] * capacity
+        self.size = [0.0] * capacity
+        self.color = [0] * capacity
+        self.crystal_colors = [pack_color(color) for color in CRYSTAL_COLORS]
+        self.texture = asset_cache.generated(arcade.make_circle_texture, PARTICLE_TEXTURE_DIAMETER, arcade.color.WHITE)
+        self.sprites = arcade.SpriteList()
+        self.drawn = 0
+
+    def __len__(self):
+        return self.count
+
+    def seed(self, value):
+        self.random.seed(value)
+
+    def burst(self, x, y, colors=None):
+        rng = self.random
+        palette = self.crystal_colors if colors is None else [pack_color(c) for c in colors]
+        num_particles = rng.randint(15, 25)
+        for _ in range(num_particles):
+            if self.count >= self.capacity:
+                return
+            i = self.count
+            speed = rng.uniform(2, 8)
+            angle = rng.uniform(0, 2 * math.pi)
+            self.x[i] = x
+            self.y[i] = y
+            self.color[i] = rng.choice(palette)
+            self.size[i] = rng.uniform(2, 6)
+            self.vx[i] = math.cos(angle) * speed
+            self.vy[i] = math.sin(angle) * speed
+            self.life[i] = 1.0
+            self.decay[i] = rng.uniform(0.02, 0.05)
+            self.count += 1
+
+    def update(self):
+        xs, ys, vxs, vys = self.x, self.y, self.vx, self.vy
+        lifes, decays, sizes, colors = self.life, self.decay, self.size, self.color
+        count = self.count
+        i = 0
+        while i < count:
+            life = lifes[i] - decays[i]
+            if life <= 0:
+                count -= 1
+                xs[i] = xs[count]
+                ys[i] = ys[count]
+                vxs[i] = vxs[count]
+                vys[i] = vys[count]
+                lifes[i] = lifes[count]
+                decays[i] = decays[count]
+                sizes[i] = sizes[count]
+                colors[i] = colors[count]
+                continue
+            xs[i] += vxs[i]
+            ys[i] += vys[i]
+            vys[i] -= PARTICLE_GRAVITY
+            lifes[i] = life
+            sizes[i] *= PARTICLE_SHRINK
+            i += 1
+        self.count = count
+
+    def draw(self):
+        sprites = self.sprites
+        count = self.count
+        while len(sprites) < count:
+            sprites.append(arcade.BasicSprite(self.texture))
+        xs, ys, lifes, sizes, colors = self.x, self.y, self.life, self.size, self.color
+        scale = 2 / PARTICLE_TEXTURE_DIAMETER
+        for i in range(count):
+            sprite = sprites[i]
+            color = colors[i]
+            sprite.position = (xs[i], ys[i])
+            sprite.scale = sizes[i] * scale
+            sprite.color = (color >> 16, (color >> 8) & 0xFF, color & 0xFF, int(255 * lifes[i]))
+        for i in range(count, self.drawn):
+            sprites[i].alpha = 0
+        self.drawn = count
+        sprites.draw()
+
+    def clear(self):
+        self.count = 0
+
+    def is_finished(self):
+        return self.count == 0
@@ -0,0 +1,52 @@
+import threading
+from queue import Queue
+
+from assets import asset_cache
+from atlas import LEVEL_ART
+from level_loader import load_level
+
+LEVEL_SOUNDS = (
+    ":resources:sounds/coin1.wav",
+    ":resources:sounds/hurt3.wav",
+    ":resources:sounds/jump3.wav",
+)
+
+
+class Preloader:
+    def __init__(self):
+        self.queue = Queue()
+        self.lock = threading.Lock()
+        self.requested = set()
+        self.thread = None
+
+    def request(self, level_num):
+        with self.lock:
+            if level_num in self.requested:
+                return
+            self.requested.add(level_num)
+            if self.thread is None:
+                self.thread = threading.Thread(target=self.run, name="preloader", daemon=True)
+                self.thread.start()
+        self.queue.put(level_num)
+
+    def run(self):
+        while True:
+            level_num = self.queue.get()
+            try:
+                level_data = load_level(level_num)
+            except Exception:
+                continue
+            for path in (level_data.music,) + LEVEL_SOUNDS:
+                if path:
+                    try:
+                        asset_cache.sound(path)
+                    except Exception:
+                        pass
+            for path in LEVEL_ART:
+                try:
+                    asset_cache.texture(path)
+                except Exception:
+                    pass
+
+
+preloader = Preloader()
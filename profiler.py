@@ -0,0 +1,105 @@
+import json
+import time
+from collections import deque
+
+import arcade
+
+from hud import Hud
+
+ROLLING_SAMPLES = 300
+REFRESH_FRAMES = 30
+PANEL_COLOR = (0, 0, 0, 160)
+STAGES = (
+    ("physics", "Физика"),
+    ("moving_objects", "Движущиеся объекты"),
+    ("particles", "Частицы"),
+    ("collisions", "Столкновения"),
+    ("scene", "Отрисовка сцены"),
+    ("particles_draw", "Отрисовка частиц"),
+    ("hud", "Интерфейс"),
+)
+SCENE_LISTS = ("Player", "Walls", "Crystals", "Spikes", "SmallSpikes", "MovingPlatforms", "Enemies")
+
+
+def percentile(ordered, fraction):
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(len(ordered) * fraction))]
+
+
+class FrameProfiler:
+    def __init__(self, samples=ROLLING_SAMPLES):
+        self.enabled = False
+        self.samples = {name: deque(maxlen=samples) for name, label in STAGES}
+        self.frames = 0
+        self.hud = None
+        self.lines = {}
+        self.counts_text = None
+        self.panel = None
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.frames = 0
+        if self.enabled and self.hud is None:
+            self.create_hud()
+
+    def create_hud(self):
+        self.hud = Hud()
+        y = 20
+        self.counts_text = self.hud.add("", 10, y, arcade.color.YELLOW, 12)
+        for name, label in reversed(STAGES):
+            y += 18
+            self.lines[name] = self.hud.add("", 10, y, arcade.color.YELLOW, 12)
+
+    def measure(self, name, func, *args):
+        if not self.enabled:
+            return func(*args)
+        start = time.perf_counter()
+        result = func(*args)
+        self.samples[name].append(time.perf_counter() - start)
+        return result
+
+    def draw(self, scene, particles, triggers, draw_calls=0):
+        if not self.enabled:
+            return
+        if self.frames % REFRESH_FRAMES == 0:
+            self.refresh(scene, particles, triggers, draw_calls)
+        self.frames += 1
+        arcade.draw_lrbt_rectangle_filled(*self.panel, PANEL_COLOR)
+        self.hud.draw()
+
+    def refresh(self, scene, particles, triggers, draw_calls):
+        for name, label in STAGES:
+            ordered = sorted(self.samples[name])
+            self.hud.update(
+                self.lines[name],
+                "{}: p50 {:.2f}  p95 {:.2f}  p99 {:.2f} мс",
+                label,
+                percentile(ordered, 0.5) * 1000,
+                percentile(ordered, 0.95) * 1000,
+                percentile(ordered, 0.99) * 1000,
+            )
+        sprites = sum(len(scene[name]) for name in SCENE_LISTS if name in scene)
+        self.hud.update(
+            self.counts_text,
+            "Спрайты: {}  Частицы: {}  Вызовы отрисовки: {}  Запросы: {}  Кандидаты: {}  Проверки: {}",
+            sprites,
+            len(particles),
+            draw_calls,
+            triggers.queries,
+            triggers.candidates,
+            triggers.checks,
+        )
+        width = max(text.content_width for text in self.hud.texts)
+        top = max(text.y + text.content_height for text in self.hud.texts)
+        self.panel = (4, width + 16, 12, top + 4)
+
+    def dump(self, filename=None):
+        filename = filename or time.strftime("frame-profile-%Y%m%d-%H%M%S.json")
+        samples = {
+            name: [round(sample * 1e6, 1) for sample in self.samples[name]]
+            for name, label in STAGES
+        }
+        with open(filename, "w", encoding="utf-8") as f:
+            json.dump({"unit": "us", "samples": samples}, f, indent=2)
+        return filename
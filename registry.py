@@ -0,0 +1,87 @@
+import importlib
+
+import arcade
+
+from geometry import SCREEN_HEIGHT, SCREEN_WIDTH
+
+LEVEL_VIEW = "runtime:LevelView"
+
+
+class LevelEntry:
+    def __init__(self, number, name, label, color, complete_text, hints=(), view=LEVEL_VIEW):
+        self.number = number
+        self.name = name
+        self.label = label
+        self.color = color
+        self.complete_text = complete_text
+        self.hints = hints
+        self.view = view
+
+
+class Theme:
+    def __init__(
+        self,
+        background_color=arcade.csscolor.CORNFLOWER_BLUE,
+        text_color=arcade.color.LIGHT_GRAY,
+        lives_position=(SCREEN_WIDTH - 120, SCREEN_HEIGHT - 60),
+        game_over_title="ИГРА ОКОНЧЕНА",
+        victory_title="ПОБЕДА!",
+        title_color=None,
+        player=None,
+        campaign=False,
+        menu=None,
+    ):
+        self.background_color = background_color
+        self.text_color = text_color
+        self.lives_position = lives_position
+        self.game_over_title = game_over_title
+        self.victory_title = victory_title
+        self.title_color = title_color
+        self.player = player
+        self.campaign = campaign
+        self.menu = menu
+
+
+DEFAULT_THEME = Theme()
+
+
+LEVELS = (
+    LevelEntry(
+        0, "Обучение", "Обучение", arcade.color.YELLOW, "Обучение завершено!",
+        hints=(
+            ("Добро пожаловать в обучение!", arcade.color.YELLOW, 16),
+            ("Соберите все кристаллы, чтобы продолжить", arcade.color.WHITE, 14),
+        ),
+    ),
+    LevelEntry(1, "Уровень 1", "1", arcade.color.GREEN, "Уровень 1 пройден!"),
+    LevelEntry(2, "Уровень 2", "2", arcade.color.ORANGE, "Уровень 2 пройден!"),
+    LevelEntry(3, "Уровень 3", "3", arcade.color.RED, "Уровень 3 пройден!"),
+    LevelEntry(4, "Уровень 4", "4", arcade.color.PURPLE, "Уровень 4 пройден!"),
+)
+TOTAL_LEVELS = len(LEVELS)
+LEVEL_NAMES = [entry.name for entry in LEVELS]
+
+
+def get_level(number):
+    return LEVELS[number]
+
+
+def next_level(number):
+    if number + 1 < TOTAL_LEVELS:
+        return number + 1
+    return None
+
+
+_view_classes = {}
+
+
+def view_class(number):
+    spec = LEVELS[number].view
+    if spec not in _view_classes:
+        module_name, class_name = spec.split(":")
+        _view_classes[spec] = getattr(importlib.import_module(module_name), class_name)
+    return _view_classes[spec]
+
+
+def create_level_view(number, theme=None):
+    return view_class(number)(number, theme)
@@ -0,0 +1,208 @@
+import hashlib
+import json
+import os
+import random
+import struct
+import sys
+
+if __name__ == "__main__" and sys.argv[1:2] != ["record"]:
+    os.environ.setdefault("ARCADE_HEADLESS", "1")
+
+import arcade
+
+from headless import (
+    PRESS,
+    RELEASE,
+    HeadlessRunner,
+    ScriptedInput,
+    create_window,
+    load_view,
+    project_path,
+    run,
+    walk_right_events,
+)
+from snapshot import MOVING_LISTS
+
+REPLAY_MAGIC = b"RPLY"
+REPLAY_VERSION = 1
+HEADER = struct.Struct("<4sHQI20sH")
+EVENT = struct.Struct("<IBI")
+ACTIONS = (PRESS, RELEASE)
+REPLAYS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "replays")
+
+
+def state_digest(view, tick):
+    values = [tick, view.score, view.crystals_collected, view.player_lives]
+    for name in MOVING_LISTS:
+        if name in view.scene:
+            for sprite in view.scene[name]:
+                values.extend((sprite.center_x, sprite.center_y, sprite.change_x, sprite.change_y))
+    particles = view.particles
+    values.append(particles.count)
+    for column in (particles.x, particles.y, particles.vx, particles.vy, particles.life, particles.size):
+        values.extend(column[:particles.count])
+    return hashlib.sha1(struct.pack(f"<{len(values)}d", *values)).digest()
+
+
+class ReplayLog:
+    def __init__(self, path, class_name, args, seed, ticks=0, digest=b"", events=None):
+        self.path = path
+        self.class_name = class_name
+        self.args = list(args)
+        self.seed = seed
+        self.ticks = ticks
+        self.digest = digest
+        self.events = events if events is not None else []
+
+    def script(self):
+        return ScriptedInput(self.events)
+
+    def save(self, filename):
+        spec = json.dumps({"path": self.path, "class": self.class_name, "args": self.args}).encode("utf-8")
+        with open(filename, "wb") as f:
+            f.write(HEADER.pack(REPLAY_MAGIC, REPLAY_VERSION, self.seed, self.ticks, self.digest, len(spec)))
+            f.write(spec)
+            f.write(struct.pack("<I", len(self.events)))
+            for tick, action, key in self.events:
+                f.write(EVENT.pack(tick, ACTIONS.index(action), key))
+
+    @classmethod
+    def load(cls, filename):
+        with open(filename, "rb") as f:
+            magic, version, seed, ticks, digest, spec_size = HEADER.unpack(f.read(HEADER.size))
+            if magic != REPLAY_MAGIC or version != REPLAY_VERSION:
+                raise ValueError(f"{filename}: not a replay log")
+            spec = json.loads(f.read(spec_size).decode("utf-8"))
+            (count,) = struct.unpack("<I", f.read(4))
+            events = []
+            for _ in range(count):
+                tick, action, key = EVENT.unpack(f.read(EVENT.size))
+                events.append((tick, ACTIONS[action], key))
+        return cls(spec["path"], spec["class"], spec["args"], seed, ticks, digest, events)
+
+
+class InputRecorder:
+    def __init__(self, view, log):
+        self.view = view
+        self.log = log
+        self.tick = 0
+        self.finished = False
+        view.particles.seed(log.seed)
+        self.on_key_press = view.on_key_press
+        self.on_key_release = view.on_key_release
+        self.fixed_update = view.fixed_update
+        view.on_key_press = self.press
+        view.on_key_release = self.release
+        view.fixed_update = self.step
+
+    def press(self, key, modifiers):
+        if not self.finished:
+            self.log.events.append((self.tick, PRESS, key))
+        self.on_key_press(key, modifiers)
+
+    def release(self, key, modifiers):
+        if not self.finished:
+            self.log.events.append((self.tick, RELEASE, key))
+        self.on_key_release(key, modifiers)
+
+    def step(self):
+        self.fixed_update()
+        if self.finished:
+            return
+        self.tick += 1
+        if self.view.window.current_view is not self.view:
+            self.finish()
+
+    def finish(self):
+        if not self.finished:
+            self.finished = True
+            self.log.ticks = self.tick
+            self.log.digest = state_digest(self.view, self.tick)
+        return self.log
+
+
+def new_log(path, class_name, args, seed=None):
+    seed = random.randrange(1 << 32) if seed is None else seed
+    return ReplayLog(path, class_name, args, seed)
+
+
+def record_live(filename, path, class_name, *args):
+    window = arcade.Window(1000, 650, "Запись повтора")
+    view = load_view(path, class_name, *args)
+    recorder = InputRecorder(view, new_log(path, class_name, args))
+    window.show_view(view)
+    arcade.run()
+    recorder.finish().save(filename)
+    return recorder.log
+
+
+def record_scripted(filename, path, class_name, *args, ticks=3600, seed=None):
+    log = new_log(path, class_name, args, seed)
+    log.events = walk_right_events(ticks)
+    runner = run(path, class_name, *args, ticks=ticks, script=log.script(), seed=log.seed)
+    log.ticks = runner.tick
+    log.digest = state_digest(runner.view, runner.tick)
+    log.events = [event for event in log.events if event[0] < runner.tick]
+    log.save(filename)
+    return log
+
+
+def trace(view, log):
+    view.particles.seed(log.seed)
+    view.window.show_view(view)
+    runner = HeadlessRunner(view, log.script())
+    digests = []
+    while runner.tick < log.ticks and runner.running:
+        runner.step()
+        digests.append(state_digest(view, runner.tick))
+    return runner, digests
+
+
+def replay(filename):
+    log = ReplayLog.load(filename)
+    create_window()
+    view = load_view(log.path, log.class_name, *log.args)
+    runner, first = trace(view, log)
+    identical = state_digest(view, runner.tick) == log.digest
+    view.reset()
+    retry, second = trace(view, log)
+    return log, runner, identical, first == second
+
+
+def main():
+    usage = (
+        "usage: python replay.py record <out.rpl> <file> <ViewClass> [level]\n"
+        "       python replay.py script <out.rpl> <file> <ViewClass> [level] [ticks]\n"
+        "       python replay.py play [log.rpl ...]  (default: every log in replays/)"
+    )
+    if len(sys.argv) < 3 and sys.argv[1:] != ["play"]:
+        print(usage)
+        sys.exit(1)
+    command = sys.argv[1]
+    if command == "play":
+        failed = 0
+        filenames = sys.argv[2:] or sorted(
+            os.path.join(REPLAYS_DIR, name) for name in os.listdir(REPLAYS_DIR) if name.endswith(".rpl")
+        )
+        for filename in filenames:
+            log, runner, identical, repeatable = replay(filename)
+            stats = runner.stats()
+            print(f"{filename}: {'ok' if identical else 'MISMATCH'}, retry {'ok' if repeatable else 'MISMATCH'} "
+                  f"{stats['ticks']}/{log.ticks} ticks, {stats['us_per_tick']} us/tick")
+            failed += not (identical and repeatable)
+        sys.exit(1 if failed else 0)
+    filename, path, class_name = sys.argv[2], project_path(sys.argv[3]), sys.argv[4]
+    args = [int(sys.argv[5])] if len(sys.argv) > 5 and sys.argv[5] != "-" else []
+    if command == "record":
+        log = record_live(filename, path, class_name, *args)
+    elif command == "script":
+        ticks = int(sys.argv[6]) if len(sys.argv) > 6 else 3600
+        log = record_scripted(filename, path, class_name, *args, ticks=ticks)
+    else:
+        print(usage)
+        sys.exit(1)
+    print(f"{filename}: {log.ticks} ticks, {len(log.events)} events, seed {log.seed}")
+
+
+if __name__ == "__main__":
+    main()
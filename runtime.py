@@ -0,0 +1,563 @@
+import arcade
+
+from assets import asset_cache
+from atlas import CRYSTAL_TEXTURE, ENEMY_TEXTURE, PLATFORM_TEXTURE, PLAYER_TEXTURE, SPIKE_TEXTURE, WALL_TEXTURE, level_atlas
+from culling import CulledScene
+from geometry import CHARACTER_SCALING, SCREEN_HEIGHT, SCREEN_WIDTH, platform_collider, set_travel_bounds
+from governor import governor
+from hud import Hud
+from kinematics import KinematicMover
+from level_loader import load_level
+from particles import ParticleEmitter
+from profiler import FrameProfiler
+from registry import DEFAULT_THEME, create_level_view, get_level, next_level
+from snapshot import LevelSnapshot
+from streaming import StreamingWorld
+from timestep import FixedTimestep
+from triggers import ENEMY, HAZARD, PICKUP, TriggerIndex
+
+TILE_SCALING = 0.5
+CRYSTAL_SCALING = 0.3
+PLAYER_MOVEMENT_SPEED = 5
+GRAVITY = 1
+PLAYER_JUMP_SPEED = 20
+SPIKE_SCALING = 0.5
+SMALL_SPIKE_SCALING = 0.3
+INTERPOLATED_LISTS = ("MovingPlatforms", "Enemies")
+
+
+class GameOverView(arcade.View):
+    def __init__(self):
+        super().__init__()
+        self.level_view = None
+        self.hud = Hud()
+        self.title_text = self.hud.add(
+            "",
+            SCREEN_WIDTH // 2,
+            SCREEN_HEIGHT // 2 + 50,
+            arcade.color.RED,
+            60,
+            anchor_x="center"
+        )
+        self.crystals_text = self.hud.add(
+            "",
+            SCREEN_WIDTH // 2,
+            SCREEN_HEIGHT // 2,
+            arcade.color.WHITE,
+            30,
+            anchor_x="center"
+        )
+        self.hud.add(
+            "Нажмите ENTER для повтора уровня",
+            SCREEN_WIDTH // 2,
+            SCREEN_HEIGHT // 2 - 50,
+            arcade.color.WHITE,
+            20,
+            anchor_x="center"
+        )
+        self.hud.add(
+            "Нажмите ESC для выхода в меню",
+            SCREEN_WIDTH // 2,
+            SCREEN_HEIGHT // 2 - 100,
+            arcade.color.WHITE,
+            20,
+            anchor_x="center"
+        )
+
+    def configure(self, level_view):
+        self.level_view = level_view
+        self.hud.update(self.title_text, "{}", level_view.theme.game_over_title)
+        self.hud.update(
+            self.crystals_text,
+            "Собрано кристаллов: {}/{}",
+            level_view.crystals_collected,
+            level_view.total_crystals
+        )
+        return self
+
+    def on_draw(self):
+        self.clear()
+        self.hud.draw()
+        governor.rest(self.window)
+
+    def on_key_press(self, key, modifiers):
+        if key == arcade.key.ENTER:
+            self.level_view.reset()
+            self.window.show_view(self.level_view)
+        elif key == arcade.key.ESCAPE:
+            self.level_view.return_to_menu()
+
+
+class VictoryView(arcade.View):
+    def __init__(self):
+        super().__init__()
+        self.level_view = None
+        self.music_player = None
+        try:
+            self.victory_music = asset_cache.sound(":resources:music/1918.mp3", self)
+        except:
+            self.victory_music = None
+        self.hud = Hud()
+        self.title_text = self.hud.add(
+            "",
+            SCREEN_WIDTH // 2,
+            SCREEN_HEIGHT // 2 + 50,
+            arcade.color.GOLD,
+            60,
+            anchor_x="center"
+        )
+        self.message_text = self.hud.add(
+            "",
+            SCREEN_WIDTH // 2,
+            SCREEN_HEIGHT // 2 - 50,
+            arcade.color.WHITE,
+            30,
+            anchor_x="center"
+        )
+        self.hud.add(
+            "Нажмите ESC для выхода в меню",
+            SCREEN_WIDTH // 2,
+            SCREEN_HEIGHT // 2 - 100,
+            arcade.color.WHITE,
+            20,
+            anchor_x="center"
+        )
+
+    def configure(self, level_view, title, message):
+        self.level_view = level_view
+        self.music_player = None
+        self.hud.update(self.title_text, "{}", title)
+        self.hud.update(self.message_text, "{}", message)
+        return self
+
+    def on_show(self):
+        if self.victory_music:
+            self.music_player = self.victory_music.play(volume=0.3, loop=True)
+
+    def on_hide(self):
+        if self.music_player:
+            self.victory_music.stop(self.music_player)
+
+    def on_draw(self):
+        self.clear()
+        self.hud.draw()
+        governor.rest(self.window)
+
+    def on_key_press(self, key, modifiers):
+        if key == arcade.key.ESCAPE:
+            if self.music_player:
+                self.victory_music.stop(self.music_player)
+            self.level_view.return_to_menu()
+
+
+class ScreenPool:
+    def __init__(self):
+        self.screens = {}
+
+    def get(self, view_class):
+        screen = self.screens.get(view_class)
+        if screen is None:
+            screen = self.screens[view_class] = view_class()
+        return screen
+
+    def prepare(self, level_view):
+        self.get(GameOverView).configure(level_view)
+        self.get(VictoryView).configure(level_view, level_view.theme.victory_title, level_view.victory_message())
+
+
+screen_pool = ScreenPool()
+
+
+class LevelView(arcade.View):
+    def __init__(self, level_num, theme=None):
+        super().__init__()
+        self.level = level_num
+        self.theme = theme or DEFAULT_THEME
+        self.entry = get_level(level_num)
+        self.level_data = load_level(level_num)
+        self.scene = None
+        self.score = 0
+        self.crystals_collected = 0
+        self.total_crystals = 0
+        self.player_lives = 5
+        self.paused = False
+        self.collect_sound = asset_cache.sound(":resources:sounds/coin1.wav", self)
+        self.hurt_sound = asset_cache.sound(":resources:sounds/hurt3.wav", self)
+        self.jump_sound = asset_cache.sound(":resources:sounds/jump3.wav", self)
+
+        self.particles = ParticleEmitter()
+        self.timestep = FixedTimestep()
+        self.profiler = FrameProfiler()
+        self.enemy_mover = KinematicMover()
+
+        try:
+            self.background_music = asset_cache.sound(self.level_data.music, self)
+            self.music_player = None
+        except:
+            self.background_music = None
+
+        arcade.set_background_color(self.theme.background_color)
+
+    def on_show(self):
+        if self.background_music:
+            self.music_player = self.background_music.play(volume=0.2, loop=True)
+
+    def on_hide(self):
+        if self.music_player and self.background_music:
+            self.background_music.stop(self.music_player)
+
+    def setup(self):
+        self.world_camera = arcade.Camera2D()
+        self.gui_camera = arcade.Camera2D()
+        self.create_hud()
+        self.scene = arcade.Scene()
+        self.wall_colliders = arcade.SpriteList(use_spatial_hash=True)
+        self.triggers = TriggerIndex()
+        self.scene.add_sprite_list("Player")
+        self.scene.add_sprite_list("Walls")
+        self.scene.add_sprite_list("Crystals", use_spatial_hash=True)
+        self.scene.add_sprite_list("Spikes", use_spatial_hash=True)
+        self.scene.add_sprite_list("SmallSpikes", use_spatial_hash=True)
+        self.scene.add_sprite_list("MovingPlatforms")
+        self.scene.add_sprite_list("Enemies")
+
+        self.player_sprite = self.create_player()
+        self.player_sprite.position = self.level_data.player_start
+
+        self.scene.add_sprite("Player", self.player_sprite)
+        self.load_textures()
+        self.total_crystals = self.level_data.count("crystals")
+
+        self.physics_engine = arcade.PhysicsEnginePlatformer(
+            self.player_sprite,
+            platforms=[self.scene.get_sprite_list("MovingPlatforms")],
+            gravity_constant=GRAVITY,
+            walls=[self.wall_colliders]
+        )
+        self.culled_scene = CulledScene(self.scene)
+        self.world = StreamingWorld(
+            self.level_data,
+            {
+                "platforms": self.create_platform,
+                "crystals": self.create_crystal,
+                "spikes": self.create_spike,
+                "small_spikes": self.create_small_spike,
+                "moving_platforms": self.create_moving_platform,
+                "enemies": self.create_enemy,
+            },
+            self.culled_scene,
+            self.triggers,
+            self.enemy_mover
+        )
+        self.snapshot = LevelSnapshot(self)
+        self.reset()
+        screen_pool.prepare(self)
+
+    def reset(self):
+        self.snapshot.restore(self)
+        self.world.reset(self.world_camera)
+        self.enemy_mover.sync()
+        self.particles.clear()
+        self.timestep.reset()
+        self.previous_player_position = self.player_sprite.position
+        self.previous_camera_position = self.world_camera.position
+        self.store_moving_positions()
+
+    def create_player(self):
+        if self.theme.player is not None:
+            return self.theme.player()
+        return arcade.Sprite(level_atlas.texture(PLAYER_TEXTURE), CHARACTER_SCALING)
+
+    def load_textures(self):
+        self.wall_texture = level_atlas.texture(WALL_TEXTURE)
+        self.crystal_texture = level_atlas.texture(CRYSTAL_TEXTURE)
+        self.spike_texture = level_atlas.texture(SPIKE_TEXTURE)
+        self.platform_texture = level_atlas.texture(PLATFORM_TEXTURE)
+        self.enemy_texture = level_atlas.texture(ENEMY_TEXTURE)
+
+    def create_platform(self, x, y, width):
+        sprites = []
+        for i in range(int(width)):
+            wall = arcade.Sprite(self.wall_texture, TILE_SCALING)
+            wall.center_x = x + i * 64
+            wall.center_y = y
+            self.scene.add_sprite("Walls", wall)
+            sprites.append(wall)
+        collider = platform_collider(x, y, width)
+        self.wall_colliders.append(collider)
+        sprites.append(collider)
+        return sprites
+
+    def create_crystal(self, x, y):
+        crystal = arcade.Sprite(self.crystal_texture, CRYSTAL_SCALING)
+        crystal.center_x = x
+        crystal.center_y = y
+        self.scene.add_sprite("Crystals", crystal)
+        self.triggers.add(crystal, PICKUP)
+        return [crystal]
+
+    def create_spike(self, x, y):
+        spike = arcade.Sprite(self.spike_texture, SPIKE_SCALING)
+        spike.center_x = x
+        spike.center_y = y
+        self.scene.add_sprite("Spikes", spike)
+        self.triggers.add(spike, HAZARD)
+        return [spike]
+
+    def create_small_spike(self, x, y):
+        spike = arcade.Sprite(self.spike_texture, SMALL_SPIKE_SCALING)
+        spike.center_x = x
+        spike.center_y = y
+        self.scene.add_sprite("SmallSpikes", spike)
+        self.triggers.add(spike, HAZARD)
+        return [spike]
+
+    def create_moving_platform(self, x, y, change_x, change_y, left, right, top, bottom):
+        platform = arcade.Sprite(self.platform_texture, TILE_SCALING)
+        platform.center_x = x
+        platform.center_y = y
+        platform.change_x = change_x
+        platform.change_y = change_y
+        set_travel_bounds(platform, left, right, top, bottom)
+        self.scene.add_sprite("MovingPlatforms", platform)
+        return [platform]
+
+    def create_enemy(self, x, y, scale, change_x, left, right):
+        enemy = arcade.Sprite(self.enemy_texture, scale)
+        enemy.center_x = x
+        enemy.center_y = y
+        enemy.change_x = change_x
+        enemy.boundary_left = left
+        enemy.boundary_right = right
+        self.scene.add_sprite("Enemies", enemy)
+        self.triggers.add(enemy, ENEMY)
+        self.enemy_mover.add(enemy)
+        return [enemy]
+
+    def title_color(self):
+        return self.theme.title_color or self.entry.color
+
+    def create_hud(self):
+        self.hud = Hud()
+        self.hud.add(
+            self.level_data.name,
+            SCREEN_WIDTH // 2,
+            SCREEN_HEIGHT - 100,
+            self.title_color(),
+            20,
+            anchor_x="center"
+        )
+        for i, (text, color, size) in enumerate(self.entry.hints):
+            self.hud.add(
+                text,
+                SCREEN_WIDTH // 2,
+                SCREEN_HEIGHT - 150 - i * 30,
+                color,
+                size,
+                anchor_x="center"
+            )
+
+        self.hud.add(
+            "M - вкл/выкл музыку",
+            SCREEN_WIDTH - 150,
+            SCREEN_HEIGHT - 20,
+            self.theme.text_color,
+            14
+        )
+
+        self.crystals_text = self.hud.add(
+            "",
+            10,
+            SCREEN_HEIGHT - 30,
+            arcade.csscolor.WHITE,
+            18
+        )
+        self.hud.add(
+            f"Уровень: {self.entry.label}",
+            10,
+            SCREEN_HEIGHT - 60,
+            arcade.csscolor.WHITE,
+            18
+        )
+
+        self.lives_text = self.hud.add(
+            "",
+            *self.theme.lives_position,
+            arcade.color.RED,
+            24
+        )
+        self.pause_text = self.hud.add(
+            "",
+            SCREEN_WIDTH // 2,
+            SCREEN_HEIGHT // 2,
+            arcade.color.WHITE,
+            48,
+            anchor_x="center"
+        )
+
+    def on_draw(self):
+        self.clear()
+        player_position = self.player_sprite.position
+        camera_position = self.world_camera.position
+        moving_positions = [(sprite, sprite.position) for sprite, previous in self.previous_moving_positions]
+        self.player_sprite.position = self.timestep.interpolate(self.previous_player_position, player_position)
+        self.world_camera.position = self.timestep.interpolate(self.previous_camera_position, camera_position)
+        for sprite, previous in self.previous_moving_positions:
+            sprite.position = self.timestep.interpolate(previous, sprite.position)
+        self.world_camera.use()
+        self.profiler.measure("scene", self.culled_scene.draw, self.world_camera)
+        self.profiler.measure("particles_draw", self.particles.draw)
+        self.player_sprite.position = player_position
+        self.world_camera.position = camera_position
+        for sprite, position in moving_positions:
+            sprite.position = position
+
+        self.gui_camera.use()
+        self.hud.update(self.crystals_text, "Кристаллы: {}/{}", self.crystals_collected, self.total_crystals)
+        self.hud.update(self.lives_text, "Жизни: {}", "♥" * self.player_lives)
+        self.profiler.measure("hud", self.hud.draw)
+        self.profiler.draw(self.scene, self.particles, self.triggers, self.culled_scene.draw_calls)
+        if self.paused:
+            governor.rest(self.window)
+
+    def on_key_press(self, key, modifiers):
+        if key == arcade.key.P:
+            self.toggle_pause()
+        elif self.paused and key != arcade.key.ESCAPE:
+            return
+        elif key == arcade.key.UP or key == arcade.key.W or key == arcade.key.SPACE:
+            if self.physics_engine.can_jump():
+                self.physics_engine.jump(PLAYER_JUMP_SPEED)
+                arcade.play_sound(self.jump_sound, volume=0.3)
+        elif key == arcade.key.LEFT or key == arcade.key.A:
+            self.player_sprite.change_x = -PLAYER_MOVEMENT_SPEED
+        elif key == arcade.key.RIGHT or key == arcade.key.D:
+            self.player_sprite.change_x = PLAYER_MOVEMENT_SPEED
+        elif key == arcade.key.ESCAPE:
+            self.return_to_menu()
+        elif key == arcade.key.F3:
+            self.profiler.toggle()
+        elif key == arcade.key.F4:
+            self.profiler.dump()
+        elif key == arcade.key.M:
+            self.toggle_music()
+
+    def on_key_release(self, key, modifiers):
+        if key == arcade.key.LEFT or key == arcade.key.A:
+            self.player_sprite.change_x = 0
+        elif key == arcade.key.RIGHT or key == arcade.key.D:
+            self.player_sprite.change_x = 0
+
+    def toggle_music(self):
+        if self.background_music:
+            if self.music_player:
+                self.background_music.stop(self.music_player)
+                self.music_player = None
+            else:
+                self.music_player = self.background_music.play(volume=0.2, loop=True)
+
+    def toggle_pause(self):
+        self.paused = not self.paused
+        self.hud.update(self.pause_text, "{}", "ПАУЗА" if self.paused else "")
+        if self.background_music and self.music_player:
+            if self.paused:
+                self.music_player.pause()
+            else:
+                self.music_player.play()
+        self.timestep.reset()
+        self.timestep.skip_next = not self.paused
+
+    def stop_music(self):
+        if self.background_music and self.music_player:
+            self.background_music.stop(self.music_player)
+
+    def camera_target(self):
+        x, y = self.player_sprite.position
+        return max(self.width / 2, x), max(self.height / 2, y)
+
+    def store_moving_positions(self):
+        self.previous_moving_positions = [
+            (sprite, sprite.position)
+            for name in INTERPOLATED_LISTS
+            for sprite in self.scene[name]
+        ]
+
+    def center_camera_to_player(self):
+        self.world_camera.position = arcade.math.lerp_2d(self.world_camera.position, self.camera_target(), 0.12)
+
+    def lose_life(self):
+        if self.player_lives > 1:
+            self.player_lives -= 1
+            arcade.play_sound(self.hurt_sound, volume=0.5)
+            self.player_sprite.position = self.level_data.player_start
+            self.previous_player_position = self.player_sprite.position
+            self.world_camera.position = self.camera_target()
+            self.previous_camera_position = self.world_camera.position
+            self.world.update(self.world_camera)
+        else:
+            self.game_over()
+
+    def game_over(self):
+        self.stop_music()
+        self.window.show_view(screen_pool.get(GameOverView).configure(self))
+
+    def complete_level(self):
+        self.stop_music()
+        number = next_level(self.level) if self.theme.campaign else None
+        if number is not None:
+            next_level_view = create_level_view(number, self.theme)
+            next_level_view.setup()
+            self.window.show_view(next_level_view)
+        else:
+            self.window.show_view(screen_pool.get(VictoryView).configure(self, self.theme.victory_title, self.victory_message()))
+
+    def victory_message(self):
+        if self.theme.campaign:
+            return "Все кристаллы собраны!"
+        return self.entry.complete_text
+
+    def return_to_menu(self):
+        if self.theme.menu is None:
+            self.window.close()
+        else:
+            self.window.show_view(self.theme.menu())
+
+    def update_moving_objects(self):
+        self.enemy_mover.update()
+
+    def on_update(self, delta_time):
+        if self.paused:
+            return
+        for _ in range(self.timestep.advance(delta_time)):
+            self.previous_player_position = self.player_sprite.position
+            self.previous_camera_position = self.world_camera.position
+            self.store_moving_positions()
+            self.fixed_update()
+            if self.window.current_view is not self:
+                break
+
+    def fixed_update(self):
+        self.profiler.measure("physics", self.physics_engine.update)
+        self.profiler.measure("moving_objects", self.update_moving_objects)
+        self.profiler.measure("particles", self.particles.update)
+
+        crystals_hit, hazard_hit = self.profiler.measure("collisions", self.triggers.query, self.player_sprite)
+
+        for crystal in crystals_hit:
+            self.particles.burst(crystal.center_x, crystal.center_y)
+
+            self.world.consume(crystal)
+            self.crystals_collected += 1
+            arcade.play_sound(self.collect_sound, volume=0.3)
+
+        if hazard_hit is not None:
+            self.lose_life()
+
+        if self.player_sprite.center_y < -100:
+            self.lose_life()
+
+        if self.crystals_collected >= self.total_crystals:
+            self.complete_level()
+
+        self.center_camera_to_player()
+        self.world.update(self.world_camera)
@@ -0,0 +1,23 @@
+MOVING_LISTS = ("Player", "MovingPlatforms", "Enemies")
+VIEW_STATE = ("score", "crystals_collected", "player_lives")
+
+
+class LevelSnapshot:
+    def __init__(self, view):
+        scene = view.scene
+        self.state = {name: getattr(view, name) for name in VIEW_STATE}
+        self.bodies = [
+            (sprite, sprite.position, sprite.change_x, sprite.change_y)
+            for name in MOVING_LISTS if name in scene
+            for sprite in scene[name]
+        ]
+        self.camera_position = view.world_camera.position
+
+    def restore(self, view):
+        for name, value in self.state.items():
+            setattr(view, name, value)
+        for sprite, position, change_x, change_y in self.bodies:
+            sprite.position = position
+            sprite.change_x = change_x
+            sprite.change_y = change_y
+        view.world_camera.position = self.camera_position
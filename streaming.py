@@ -0,0 +1,96 @@
+from geometry import TILE_SIZE
+from level_loader import STREAM_COLUMN_WIDTH, stream_column
+
+LOAD_DISTANCE = 512
+EVICT_DISTANCE = 1536
+
+
+class StreamingWorld:
+    def __init__(self, level_data, builders, culled_scene, triggers, mover=None):
+        self.level_data = level_data
+        self.builders = builders
+        self.culled_scene = culled_scene
+        self.triggers = triggers
+        self.mover = mover
+        self.loaded = {}
+        self.keys = {}
+        self.consumed = set()
+        self.hidden = {}
+        self.initial = {}
+        self.loads = 0
+        self.evictions = 0
+
+    def column_rows(self, column):
+        for section in self.builders:
+            for index, start, tiles in self.level_data.column_entries(section, column):
+                row = self.level_data.row(section, index)
+                if tiles:
+                    x, y, width = row
+                    row = (x + start * TILE_SIZE, y, tiles)
+                yield (section, index), row
+
+    def load(self, column):
+        sprites = []
+        for key, row in self.column_rows(column):
+            if key in self.consumed:
+                continue
+            for sprite in self.builders[key[0]](*row):
+                self.keys[sprite] = key
+                if sprite.change_x or sprite.change_y:
+                    self.initial[sprite] = (sprite.position, sprite.change_x, sprite.change_y)
+                sprites.append(sprite)
+        self.loaded[column] = (sprites, self.culled_scene.add_chunks(sprites))
+        self.loads += 1
+
+    def unload(self, column):
+        sprites, chunks = self.loaded.pop(column)
+        for sprite in sprites:
+            self.triggers.remove(sprite)
+            if self.mover is not None:
+                self.mover.remove(sprite)
+            sprite.remove_from_sprite_lists()
+            self.hidden.pop(self.keys.pop(sprite), None)
+            self.initial.pop(sprite, None)
+        self.culled_scene.remove_chunks(chunks)
+        self.evictions += 1
+
+    def consume(self, sprite):
+        key = self.keys[sprite]
+        self.consumed.add(key)
+        self.hidden[key] = (sprite, self.triggers.kinds[sprite])
+        self.triggers.remove(sprite)
+        sprite.visible = False
+
+    def visible_columns(self, camera):
+        x = camera.position[0]
+        return range(stream_column(x + camera.left - LOAD_DISTANCE), stream_column(x + camera.right + LOAD_DISTANCE) + 1)
+
+    def update(self, camera):
+        x = camera.position[0]
+        left = x + camera.left
+        right = x + camera.right
+        for column in self.visible_columns(camera):
+            if column not in self.loaded:
+                self.load(column)
+        for column in list(self.loaded):
+            if (column + 1) * STREAM_COLUMN_WIDTH < left - EVICT_DISTANCE or column * STREAM_COLUMN_WIDTH > right + EVICT_DISTANCE:
+                self.unload(column)
+
+    def reset(self, camera):
+        for sprite, kind in self.hidden.values():
+            sprite.visible = True
+            self.triggers.add(sprite, kind)
+        self.hidden.clear()
+        self.consumed.clear()
+        columns = self.visible_columns(camera)
+        for column in list(self.loaded):
+            if column not in columns:
+                self.unload(column)
+        for sprite, (position, change_x, change_y) in self.initial.items():
+            sprite.position = position
+            sprite.change_x = change_x
+            sprite.change_y = change_y
+        self.update(camera)
+
+    def sprite_count(self):
+        return len(self.keys)
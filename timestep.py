@@ -0,0 +1,34 @@
+import arcade
+
+SIMULATION_RATE = 60
+MAX_CATCH_UP_STEPS = 5
+
+
+class FixedTimestep:
+    def __init__(self, rate=SIMULATION_RATE, max_steps=MAX_CATCH_UP_STEPS):
+        self.step = 1 / rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.alpha = 0.0
+        self.skip_next = False
+
+    def advance(self, delta_time):
+        if self.skip_next:
+            self.skip_next = False
+            return 0
+        self.accumulator += delta_time
+        steps = int(self.accumulator / self.step)
+        if steps > self.max_steps:
+            steps = self.max_steps
+            self.accumulator = 0.0
+        else:
+            self.accumulator -= steps * self.step
+        self.alpha = self.accumulator / self.step
+        return steps
+
+    def reset(self):
+        self.accumulator = 0.0
+        self.alpha = 0.0
+
+    def interpolate(self, previous, current):
+        return arcade.math.lerp_2d(previous, current, self.alpha)
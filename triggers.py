@@ -0,0 +1,50 @@
+import arcade
+
+HAZARD = "hazard"
+PICKUP = "pickup"
+ENEMY = "enemy"
+
+
+def position_key(sprite):
+    return sprite.center_x, sprite.center_y
+
+
+class TriggerIndex:
+    def __init__(self):
+        self.sprites = arcade.SpriteList(use_spatial_hash=True)
+        self.kinds = {}
+        self.queries = 0
+        self.candidates = 0
+        self.checks = 0
+
+    def __len__(self):
+        return len(self.sprites)
+
+    def add(self, sprite, kind):
+        self.sprites.append(sprite)
+        self.kinds[sprite] = kind
+
+    def remove(self, sprite):
+        if self.kinds.pop(sprite, None) is not None and self.sprites in sprite.sprite_lists:
+            self.sprites.remove(sprite)
+
+    def query(self, sprite):
+        self.queries += 1
+        self.candidates = 0
+        self.checks = 0
+        pickups = []
+        hazard = None
+        for other in self.sprites.spatial_hash.get_sprites_near_sprite(sprite):
+            self.candidates += 1
+            kind = self.kinds[other]
+            if kind != PICKUP and hazard is not None:
+                continue
+            self.checks += 1
+            if arcade.check_for_collision(sprite, other):
+                if kind == PICKUP:
+                    pickups.append(other)
+                else:
+                    hazard = other
+        if len(pickups) > 1:
+            pickups.sort(key=position_key)
+        return pickups, hazard